@@ -1,100 +1,240 @@
+# --- gevent monkey patching must run before anything imports socket/ssl (pymongo, certifi, smtplib) ---
+# wsgi.py normally patches first; this only patches when app.py is run directly.
+from gevent import monkey
+if not monkey.is_module_patched('ssl'):
+    monkey.patch_all()
+# --- END gevent setup ---
+
 import os
+import functools
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-# --- gevent monkey patching should be as early as possible ---
-from gevent import monkey
-monkey.patch_all()
-# --- END gevent setup ---
-
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, abort
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
-from datetime import datetime
+from pymongo.errors import ConnectionFailure, PyMongoError, ServerSelectionTimeoutError
+from bson.datetime_ms import DatetimeMS
+import time
 import logging
 import certifi
+import orjson
+from whitenoise import WhiteNoise
 
-import traceback
+import queue
 import smtplib
+import ssl
+import uuid
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from email.utils import formataddr
 
+import db_batcher
+import email_worker
+
+# --- Logging Configuration ---
+# Configured once at import so repeated create_app() calls don't redo it
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
 # --- Import Flask-Limiter components BEFORE using them ---
 # These imports MUST come before the 'limiter = Limiter(...)' line
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
-# Initialize Limiter here, AFTER its components are imported
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"]
-)
+# Initialize Limiter here, AFTER its components are imported.
+# Default limits, storage and strategy all come from app.config in create_app().
+limiter = Limiter(key_func=get_remote_address)
+
+# --- Paths ---
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_STATIC = os.path.join(_HERE, 'frontend')
+_INDEX_PATH = os.path.join(_STATIC, 'index.html')
+_RESUME_PATH = os.path.join(_STATIC, 'assets', 'Devadarshini_Resume.pdf')
+
+# --- CORS origins ---
+# Built once at import; the Render URL is only trusted when actually running on Render
+ALLOWED_ORIGINS = frozenset(filter(None, [
+    "null",
+    "http://127.0.0.1:5500",
+    "http://localhost:5000",
+    os.environ.get('RENDER_EXTERNAL_URL') if "RENDER" in os.environ else None,
+]))
+
+# --- Input validation ---
+# Cheap checks done before any MongoDB or SMTP work, so oversized or malformed input is rejected early
+_MAX_EMAIL = 254
+_MAX_NAME = 128
+_MAX_SUBJECT = 256
+_MAX_MSG = 4096
+_MAX_RESUME_BODY = 2048 # A name and an email address, with room for JSON escaping
+# Worst valid contact body: name + subject + message at 4 UTF-8 bytes per character plus the email is ~18 KB,
+# and JSON escaping of newlines/quotes adds more, so 32 KiB leaves headroom without rejecting real input
+_MAX_CONTACT_BODY = 32 * 1024
+
+def _is_text(value, max_length):
+    """True for a non-empty string of at most max_length characters."""
+    return isinstance(value, str) and 0 < len(value) <= max_length
+
+def is_valid_email(email):
+    """True for a plausible address: something@domain.tld with no whitespace.
+
+    Plain str methods instead of a regex; isprintable() rejects newlines and tabs,
+    so the address is also safe to put in a header. Only ASCII addresses are accepted
+    because resume emails go out through sendmail(), which has no SMTPUTF8 support.
+    """
+    if not _is_text(email, _MAX_EMAIL) or not email.isascii() or " " in email or not email.isprintable():
+        return False
+    at = email.find("@")
+    if at <= 0 or email.find("@", at + 1) != -1:
+        return False
+    dot = email.find(".", at + 2)
+    return 0 <= dot < len(email) - 1
+
+# --- Email credentials ---
+# Read once at startup; they don't change while the process runs.
+_SENDER_EMAIL = os.environ.get('SENDER_EMAIL')
+_SENDER_PASSWORD = os.environ.get('SENDER_PASSWORD') # This should be your App Password
+_EMAIL_CONFIGURED = bool(_SENDER_EMAIL and _SENDER_PASSWORD)
+if not _EMAIL_CONFIGURED:
+    logger.error("Email configuration (SENDER_EMAIL, SENDER_PASSWORD) is missing from .env file. Emails will not be sent.")
+
+# --- SMTP connection pool ---
+# Logged-in SMTP sessions are reused across sends instead of paying TCP + TLS + AUTH every time.
+# Slots hold (session, last_used) and start out empty (None); they are connected lazily the first
+# time they are checked out. A session that sat idle long enough for the server to drop it is
+# probed with NOOP before reuse, so only stale sessions pay for a health check.
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465 # Implicit TLS, no STARTTLS round-trip
+SMTP_POOL_SIZE = 4
+SMTP_IDLE_CHECK = 60 # Seconds unused before a pooled session is probed with NOOP
+SMTP_TIMEOUT = 10 # Seconds; a stalled server fails the send instead of tying up one of the few email workers
+# Built once and shared; without an explicit context SMTP_SSL skips certificate verification
+_SMTP_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# LIFO hands out the most recently used session first, so idle ones sink to the bottom
+smtp_pool = queue.LifoQueue(maxsize=SMTP_POOL_SIZE)
+for _ in range(SMTP_POOL_SIZE):
+    smtp_pool.put(None)
+
+def _smtp_connect():
+    server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, context=_SMTP_SSL_CONTEXT, timeout=SMTP_TIMEOUT)
+    server.login(_SENDER_EMAIL, _SENDER_PASSWORD)
+    return server
+
+def _smtp_alive(conn):
+    try:
+        return conn.noop()[0] == 250
+    except (smtplib.SMTPException, OSError):
+        return False
+
+def _smtp_deliver(conn, msg, to_addrs):
+    if isinstance(msg, str):
+        conn.sendmail(_SENDER_EMAIL, to_addrs, msg)
+    else:
+        conn.send_message(msg)
+
+def _smtp_send(msg, to_addrs=None):
+    """Sends a message over a pooled SMTP session, reconnecting once if the server dropped it.
+
+    msg is either an email Message or an already rendered string, which is sent to to_addrs as is.
+    """
+    entry = smtp_pool.get()
+    conn = None
+    try:
+        if entry is not None:
+            conn, last_used = entry
+            if time.monotonic() - last_used > SMTP_IDLE_CHECK and not _smtp_alive(conn):
+                conn.close()
+                conn = None
+        if conn is None:
+            conn = _smtp_connect()
+        try:
+            _smtp_deliver(conn, msg, to_addrs)
+        except smtplib.SMTPServerDisconnected:
+            conn = _smtp_connect()
+            _smtp_deliver(conn, msg, to_addrs)
+    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException):
+        # The server refused this message and smtplib has already sent RSET, so an open session stays usable
+        if conn is not None and conn.sock is None:
+            conn = None
+        raise
+    except Exception:
+        # Don't hand a session in an unknown state to the next sender
+        if conn is not None:
+            conn.close()
+        conn = None
+        raise
+    finally:
+        smtp_pool.put(None if conn is None else (conn, time.monotonic()))
+
+# --- Resume attachment ---
+# The PDF never changes at runtime, so it is read, base64-encoded and rendered to text once here.
+# Each resume email only renders its small headers + greeting part and splices this block in before
+# the closing boundary, so the generator never walks the attachment again. The boundary is random
+# per process so user-supplied text can't collide with it.
+_RESUME_NAME = os.path.basename(_RESUME_PATH)
+_RESUME_BOUNDARY = f"==resume-{uuid.uuid4().hex}=="
+_RESUME_CLOSING = f"\n--{_RESUME_BOUNDARY}--"
+# Only the rendered block is kept; the raw PDF bytes are not held alongside it.
+try:
+    with open(_RESUME_PATH, "rb") as attachment:
+        _resume_part = MIMEApplication(attachment.read(), Name=_RESUME_NAME)
+    _resume_part['Content-Disposition'] = f'attachment; filename="{_RESUME_NAME}"'
+    _RESUME_ATTACHMENT_BLOCK = f"\n--{_RESUME_BOUNDARY}\n{_resume_part.as_string()}"
+    del _resume_part
+except OSError:
+    _RESUME_ATTACHMENT_BLOCK = None # Reported when a resume email is attempted
 
 # --- Email sending helper functions ---
 def send_email_with_resume(recipient_email, recipient_name):
     """Sends an email with the resume attached."""
-    sender_email = os.environ.get('SENDER_EMAIL')
-    sender_password = os.environ.get('SENDER_PASSWORD') # This should be your App Password
+    if not _EMAIL_CONFIGURED:
+        return False # Already reported once at startup
 
     try:
-        if not all([sender_email, sender_password]):
-            logging.error("Email configuration (SENDER_EMAIL, SENDER_PASSWORD) is missing from .env file for resume.")
+        if _RESUME_ATTACHMENT_BLOCK is None:
+            logger.error("Resume file not found at: %s", _RESUME_PATH)
             return False
 
-        msg = MIMEMultipart()
-        msg['From'] = formataddr(('Devadarshini', sender_email))
+        msg = MIMEMultipart(boundary=_RESUME_BOUNDARY)
+        msg['From'] = formataddr(('Devadarshini', _SENDER_EMAIL))
         msg['To'] = recipient_email
         msg['Subject'] = "Here is the Resume You Requested"
 
         body = f"Hi {recipient_name},\n\nThank you for your interest! Please find my resume attached.\n\nBest regards,\nDevadarshini"
         msg.attach(MIMEText(body, 'plain'))
 
-        resume_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend', 'assets', 'Devadarshini_Resume.pdf')
-
-        if not os.path.exists(resume_path):
-            logging.error(f"Resume file not found at: {resume_path}")
-            return False
-
-        with open(resume_path, "rb") as attachment:
-            part = MIMEApplication(attachment.read(), Name=os.path.basename(resume_path))
-        part['Content-Disposition'] = f'attachment; filename="{os.path.basename(resume_path)}"'
-        msg.attach(part)
-
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
-        logging.info(f"Successfully sent resume to {recipient_email}")
+        rendered = msg.as_string()
+        closing = rendered.rindex(_RESUME_CLOSING)
+        _smtp_send(rendered[:closing] + _RESUME_ATTACHMENT_BLOCK + rendered[closing:], [recipient_email])
+        logger.info("Successfully sent resume to %s", recipient_email)
         return True
     except smtplib.SMTPAuthenticationError:
-        logging.error("SMTP Authentication Error for resume. Check SENDER_EMAIL and SENDER_PASSWORD (App Password).")
+        logger.error("SMTP Authentication Error for resume. Check SENDER_EMAIL and SENDER_PASSWORD (App Password).")
         return False
-    except Exception as e:
-        tb_str = traceback.format_exc()
-        logging.error(f"Failed to send email to {recipient_email}. Error: {e}\nTraceback:\n{tb_str}")
+    except Exception:
+        logger.exception("Failed to send email to %s", recipient_email)
         return False
 
 def send_contact_email(name, from_email, subject, message_body):
     """Sends a contact form email to the site owner."""
-    sender_email = os.environ.get('SENDER_EMAIL')
-    sender_password = os.environ.get('SENDER_PASSWORD')
-    recipient_email = sender_email # The email is sent to myself
+    if not _EMAIL_CONFIGURED:
+        return False # Already reported once at startup
+
+    recipient_email = _SENDER_EMAIL # The email is sent to myself
 
     try:
-        if not all([sender_email, sender_password]):
-            logging.error("Email configuration (SENDER_EMAIL, SENDER_PASSWORD) is missing for contact.")
-            return False
-        
         safe_name = name.replace('\n', ' ').replace('\r', '')
         safe_subject = subject.replace('\n', ' ').replace('\r', '')
 
         msg = MIMEMultipart()
-        msg['From'] = formataddr((safe_name, sender_email))
+        msg['From'] = formataddr((safe_name, _SENDER_EMAIL))
         msg['To'] = recipient_email
         msg.add_header('Reply-To', from_email)
         msg['Subject'] = f"Portfolio Contact: {safe_subject}"
@@ -105,60 +245,98 @@ def send_contact_email(name, from_email, subject, message_body):
         full_message += f"Message:\n---\n{message_body}\n---"
         msg.attach(MIMEText(full_message, 'plain'))
 
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
-        logging.info(f"Successfully sent contact email from {from_email}")
+        _smtp_send(msg)
+        logger.info("Successfully sent contact email from %s", from_email)
         return True
     except smtplib.SMTPAuthenticationError:
-        logging.error("SMTP Authentication Error for contact. Check SENDER_EMAIL and SENDER_PASSWORD (App Password).")
+        logger.error("SMTP Authentication Error for contact. Check SENDER_EMAIL and SENDER_PASSWORD (App Password).")
         return False
-    except Exception as e:
-        tb_str = traceback.format_exc()
-        logging.error(f"Failed to send contact email from {from_email}. Error: {e}\nTraceback:\n{tb_str}")
+    except Exception:
+        logger.exception("Failed to send contact email from %s", from_email)
         return False
 
+def _static_cache_headers(headers, path, url):
+    # Shorter lifetime for the page itself than for its assets so edits show up quickly
+    if path == _INDEX_PATH:
+        headers['Cache-Control'] = 'max-age=300, public'
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() and request.get_json() skip the stdlib json module."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def require_db(app):
+    """Route decorator that swaps in a 503 handler when the app started without a database.
+
+    app.db is only set at startup, so this is decided once at registration time
+    instead of being checked on every request.
+    """
+    def decorator(view):
+        if app.db is not None:
+            return view
+
+        @functools.wraps(view)
+        def database_unavailable(*args, **kwargs):
+            logger.error("Database connection not established. Cannot process %s.", request.path)
+            return jsonify({'error': 'Server error: Database not available.'}), 503
+        return database_unavailable
+    return decorator
+
 # --- Flask App Factory ---
 def create_app():
     """Creates and configures the Flask application using the factory pattern."""
-    app = Flask(__name__, static_folder=f'{os.path.dirname(os.path.abspath(__file__))}/frontend', static_url_path='')
+    app = Flask(__name__, static_folder=_STATIC, static_url_path='')
+    app.json = ORJSONProvider(app)
 
     # --- Configuration (now loaded from .env or environment variables) ---
     app.config["MONGO_URI"] = os.environ.get('MONGO_URI')
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600 # Only for files WhiteNoise didn't see at startup
+    app.config["MAX_CONTENT_LENGTH"] = _MAX_CONTACT_BODY # Largest route body; Werkzeug refuses bigger ones before parsing
 
     app.config["RATELIMIT_DEFAULT"] = "200 per day, 50 per hour"
-    app.config["RATELIMIT_STORAGE_URI"] = "memory://" # Explicitly set for clarity, silences warning
-
-    # --- Logging Configuration ---
-    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    # Redis-backed counters are shared by every Gunicorn worker instead of each keeping its own
+    app.config["RATELIMIT_STORAGE_URI"] = os.environ.get('REDIS_URL', 'redis://localhost:6379/1')
+    app.config["RATELIMIT_STRATEGY"] = "fixed-window" # One counter per key, no per-hit timestamps
+    # If Redis is unreachable (e.g. local development) keep limiting with per-process memory:// counters;
+    # Flask-Limiter switches back to Redis once it answers again
+    app.config["RATELIMIT_IN_MEMORY_FALLBACK_ENABLED"] = True
 
     # --- CORS Configuration ---
-    allowed_origins = ["null", "http://127.0.0.1:5500", "http://localhost:5000"]
-
-    if "RENDER" in os.environ:
-        render_url = os.environ.get('RENDER_EXTERNAL_URL')
-        if render_url:
-            allowed_origins.append(render_url)
-
-    CORS(app, resources={r"/api/*": {"origins": allowed_origins}})
+    # max_age lets browsers cache the preflight for 24h instead of sending OPTIONS before every POST
+    CORS(app, resources={r"/api/*": {
+        "origins": list(ALLOWED_ORIGINS),
+        "methods": ["GET", "POST", "OPTIONS"],
+        "allow_headers": ["Content-Type"],
+        "max_age": 86400,
+    }})
 
     # --- Rate Limiting ---
     limiter.init_app(app) # Initialize limiter with the app instance (this happens inside create_app)
 
+    # --- Background Email Workers ---
+    # One worker per pooled SMTP session lets sends run concurrently without waiting on the pool
+    email_worker.start(SMTP_POOL_SIZE)
+
     # --- Custom JSON Error Handlers ---
     @app.errorhandler(400)
     def bad_request_handler(e):
         return jsonify(error=f"Bad Request: {e.description}"), 400
 
+    @app.errorhandler(413)
+    def payload_too_large_handler(e):
+        return jsonify(error="Request payload too large."), 413
+
     @app.errorhandler(429)
     def ratelimit_handler(e):
         return jsonify(error=f"Rate limit exceeded: {e.description}"), 429
 
     @app.errorhandler(500)
     def internal_server_error_handler(e):
-        tb_str = traceback.format_exc()
-        logging.error(f"An unhandled exception occurred (500 error): {e}\nTraceback:\n{tb_str}")
+        logger.exception("An unhandled exception occurred (500 error): %s", e)
         return jsonify(error="An internal server error occurred. Please try again later."), 500
 
     # --- MongoDB Connection ---
@@ -166,55 +344,91 @@ def create_app():
         if not app.config["MONGO_URI"]:
             raise ValueError("MONGO_URI not found. Please set it in your .env file or as an environment variable.")
 
-        client = MongoClient(app.config["MONGO_URI"], tlsCAFile=certifi.where(), serverSelectionTimeoutMS=5000)
+        client = MongoClient(
+            app.config["MONGO_URI"],
+            tlsCAFile=certifi.where(),
+            serverSelectionTimeoutMS=5000,
+            # Keep warm TLS connections around and bound how many a burst can open.
+            # maxPoolSize is per Gunicorn worker, so 4 workers stay well under Atlas connection limits.
+            maxPoolSize=50,
+            minPoolSize=10,
+            maxIdleTimeMS=300000,
+            connectTimeoutMS=5000,
+            socketTimeoutMS=5000,
+            waitQueueTimeoutMS=2000,
+            retryWrites=True,
+            appname="portfolio",
+        )
         client.admin.command('ping')
         app.db = client.portfolio_db
-        logging.info("✅ Successfully connected to MongoDB!")
+        logger.info("✅ Successfully connected to MongoDB!")
+        # Resume requests are only a log, so they are written in batches rather than one insert per request
+        app.resume_batcher = db_batcher.Batcher(app.db.resume_requests)
     except (ConnectionFailure, ValueError, ServerSelectionTimeoutError) as e:
-        logging.error(f"❌ Error connecting to MongoDB: {e}")
+        logger.error("❌ Error connecting to MongoDB: %s", e)
         app.db = None
+        app.resume_batcher = None
+
+    # Index resume requests for looking up someone's latest request; created once, a no-op if it exists
+    if app.db is not None:
+        try:
+            app.db.resume_requests.create_index([("email", 1), ("timestamp", -1)])
+        except PyMongoError as e:
+            logger.error("Could not create resume_requests index: %s", e)
 
     # --- API Route for Resume Request (Keeps MongoDB storage) ---
     @app.route('/api/request-resume', methods=['POST'])
     @limiter.limit("5 per day")
+    @require_db(app)
     def request_resume():
-        if app.db is None:
-            logging.error("Database connection not established. Cannot process resume request.")
-            return jsonify({'error': 'Server error: Database not available.'}), 500
+        # Checked from the header alone, before the JSON parser sees the body
+        if request.content_length and request.content_length > _MAX_RESUME_BODY:
+            abort(413)
+
+        data = request.get_json(silent=True, cache=False)
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Invalid JSON data in request.'}), 400
 
-        data = request.get_json()
         name = data.get('name')
         email = data.get('email')
+        if isinstance(email, str):
+            # Normalized once so stored requests (and the email index) see one spelling per address
+            email = email.strip().lower()
 
         if not name or not email:
             return jsonify({'error': 'Name and Email are required.'}), 400
 
+        if not _is_text(name, _MAX_NAME) or not is_valid_email(email):
+            return jsonify({'error': 'Please provide a valid name and email address.'}), 400
+
+        if not _EMAIL_CONFIGURED:
+            return jsonify({'error': 'Sorry, the resume cannot be sent right now. Please try again later.'}), 503
+
         try:
-            resume_requests_collection = app.db.resume_requests
-            resume_requests_collection.insert_one({
+            app.resume_batcher.put({
                 'name': name,
                 'email': email,
-                'timestamp': datetime.utcnow()
+                'timestamp': DatetimeMS(int(time.time() * 1000))
             })
-            logging.info(f"Resume request saved for: {email}")
-
-            if send_email_with_resume(email, name):
-                return jsonify({'message': 'Your request has been received! The resume has been sent to your email.'}), 200
-            else:
-                logging.error(f"Failed to send resume email to {email}, but request was saved.")
-                return jsonify({'message': 'Your request was saved, but there was an issue sending the email. I will follow up with you manually.'}), 202
-        except Exception as e:
-            tb_str = traceback.format_exc()
-            logging.error(f"Error processing resume request (MongoDB or email sending): {e}\nTraceback:\n{tb_str}")
+            logger.info("Resume request queued for: %s", email)
+
+            email_worker.enqueue(send_email_with_resume, email, name)
+            return jsonify({'message': 'Your request has been received! The resume will be sent to your email shortly.'}), 202
+        except Exception:
+            logger.exception("Error processing resume request")
             return jsonify({'error': 'An error occurred while processing your resume request.'}), 500
 
     # --- API Route for Contact Form (NO MongoDB storage) ---
     @app.route('/api/contact', methods=['POST'])
     @limiter.limit("10 per hour")
     def contact_form():
+        # Checked from the header alone, before the JSON parser sees the body
+        if request.content_length and request.content_length > _MAX_CONTACT_BODY:
+            abort(413)
+
         try:
-            data = request.get_json()
-            if not data:
+            data = request.get_json(silent=True, cache=False)
+            if not isinstance(data, dict) or not data:
                 return jsonify({'error': 'Invalid JSON data in request.'}), 400
 
             name = data.get('name')
@@ -225,25 +439,41 @@ def create_app():
             if not all([name, email, subject, message]):
                 return jsonify({'error': 'All fields (Name, Email, Subject, Message) are required.'}), 400
 
-            if send_contact_email(name, email, subject, message):
-                return jsonify({'message': 'Thank you for your message! I will get back to you soon.'}), 200
-            else:
-                logging.error(f"Failed to send contact email from {email}. (send_contact_email returned False)")
-                return jsonify({'error': 'Sorry, there was an error sending your message. Please try again later.'}), 500
-        except Exception as e:
-            tb_str = traceback.format_exc()
-            logging.error(f"Critical error in contact_form route: {e}\nTraceback:\n{tb_str}")
+            if not is_valid_email(email):
+                return jsonify({'error': 'Please provide a valid email address.'}), 400
+
+            if not (_is_text(name, _MAX_NAME) and _is_text(subject, _MAX_SUBJECT) and _is_text(message, _MAX_MSG)):
+                return jsonify({'error': f'Name, Subject or Message is too long (message limit is {_MAX_MSG} characters).'}), 400
+
+            if not _EMAIL_CONFIGURED:
+                return jsonify({'error': 'Sorry, messages cannot be sent right now. Please try again later.'}), 503
+            email_worker.enqueue(send_contact_email, name, email, subject, message)
+            return jsonify({'message': 'Thank you for your message! I will get back to you soon.'}), 202
+        except HTTPException:
+            raise # e.g. 413 from MAX_CONTENT_LENGTH; let the JSON error handlers answer it
+        except Exception:
+            logger.exception("Critical error in contact_form route")
             return jsonify({'error': 'An unexpected server error occurred while processing your message. Please try again later.'}), 500
 
     # --- Serve Frontend ---
-    @app.route('/')
-    def serve_index():
-        return send_from_directory(app.static_folder, 'index.html')
+    # WhiteNoise answers '/' and every file under frontend/ before Flask is reached: files are indexed
+    # once at startup, pre-compressed .gz variants from start.sh are used, and ETags allow 304s.
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=_STATIC,
+        index_file=True,
+        max_age=3600,
+        autorefresh=False,
+        add_headers_function=_static_cache_headers,
+    )
 
     return app
 
 # This entry point is used for local development.
-# For production, Gunicorn will call create_app() directly.
+# For production, Gunicorn loads wsgi.py, which patches gevent and then calls create_app().
+# It uses gevent's WSGI server so SMTP and MongoDB I/O overlap across requests just like in production.
 if __name__ == '__main__':
+    from gevent.pywsgi import WSGIServer
+
     app = create_app()
-    app.run(port=5000, debug=False) # Set debug to False for production readiness
\ No newline at end of file
+    WSGIServer(('127.0.0.1', 5000), app).serve_forever()
\ No newline at end of file
@@ -0,0 +1,53 @@
+# --- Batched MongoDB writes ---
+# Log-style documents are buffered per collection and written with a single
+# insert_many(ordered=False) every flush interval, or sooner once max_size documents are waiting,
+# so many requests share one round-trip to the database.
+import atexit
+import collections
+import logging
+
+import gevent
+import gevent.event
+import gevent.lock
+
+logger = logging.getLogger(__name__)
+
+class Batcher:
+    """Write-behind buffer for one collection, flushed by its own background greenlet."""
+
+    def __init__(self, collection, max_size=256, flush_ms=500):
+        self.collection = collection
+        self.max_size = max_size
+        self.flush_interval = flush_ms / 1000
+        self._buffer = collections.deque()
+        self._lock = gevent.lock.Semaphore()
+        self._flush_now = gevent.event.Event()
+        self._flusher = gevent.spawn(self._run)
+        # A graceful shutdown (e.g. a redeploy) would otherwise lose whatever is still buffered
+        atexit.register(self.flush)
+
+    def put(self, document):
+        """Buffers a document for the next batched insert."""
+        with self._lock:
+            self._buffer.append(document)
+            full = len(self._buffer) >= self.max_size
+        if full:
+            self._flush_now.set()
+
+    def flush(self):
+        """Writes everything buffered so far."""
+        with self._lock:
+            batch = list(self._buffer)
+            self._buffer.clear()
+        if not batch:
+            return
+        try:
+            self.collection.insert_many(batch, ordered=False)
+        except Exception:
+            logger.exception("Failed to write %d buffered documents to %s", len(batch), self.collection.name)
+
+    def _run(self):
+        while True:
+            self._flush_now.wait(self.flush_interval)
+            self._flush_now.clear()
+            self.flush()
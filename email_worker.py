@@ -0,0 +1,41 @@
+# --- Background email queue ---
+# SMTP is slow, so the API routes enqueue (func, args) jobs here and respond straight away.
+# Worker greenlets drain the queue; under gevent's monkey patching they behave like daemon threads.
+import atexit
+import logging
+
+import gevent
+import gevent.queue
+
+logger = logging.getLogger(__name__)
+
+DRAIN_TIMEOUT = 10 # Seconds to keep sending queued emails when the process exits (e.g. a redeploy)
+
+email_queue = gevent.queue.JoinableQueue()
+_workers = []
+
+def enqueue(func, *args):
+    """Queues func(*args) to be run by a background worker."""
+    email_queue.put((func, args))
+
+def _worker():
+    """Runs queued email jobs forever."""
+    while True:
+        func, args = email_queue.get()
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("Background email job %s failed", func.__name__)
+        finally:
+            email_queue.task_done()
+
+def drain(timeout=DRAIN_TIMEOUT):
+    """Waits up to `timeout` seconds for queued jobs to finish, logging any that are left unsent."""
+    if not email_queue.join(timeout=timeout):
+        logger.error("Exiting with %d email jobs still queued; they will not be sent", email_queue.unfinished_tasks)
+
+def start(count):
+    """Starts `count` workers for this process and drains them at exit. Later calls are no-ops."""
+    if not _workers:
+        _workers.extend(gevent.spawn(_worker) for _ in range(count))
+        atexit.register(drain)
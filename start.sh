@@ -1,9 +1,11 @@
 #!/usr/bin/env bash
 # This command tells Gunicorn to run your Flask app.
-# 'app:create_app()' means:
-#   - import 'app.py' module
-#   - call the 'create_app()' function within it
-#   - this function is expected to return your Flask application instance.
+# 'wsgi:app' means:
+#   - import 'wsgi.py' module, which applies gevent monkey patching before anything else
+#   - use the 'app' object it builds with create_app() from 'app.py'
+# Pre-compress the frontend so WhiteNoise can serve .gz files without compressing per request.
+python -m whitenoise.compress frontend
 # --workers 4 is a good starting point for concurrency.
+# --worker-connections 1000 caps the concurrent greenlets (in-flight requests) per gevent worker.
 # --bind 0.0.0.0:$PORT tells Gunicorn to listen on the port Render provides.
-gunicorn --worker-class gevent --workers 4 --bind 0.0.0.0:$PORT 'app:create_app()'
\ No newline at end of file
+gunicorn --worker-class gevent --workers 4 --worker-connections 1000 --bind 0.0.0.0:$PORT 'wsgi:app'
\ No newline at end of file
@@ -0,0 +1,9 @@
+# Gunicorn entry point.
+# Patching must be the very first thing that happens so that pymongo, ssl and smtplib
+# only ever see gevent's cooperative sockets.
+from gevent import monkey
+monkey.patch_all()
+
+from app import create_app
+
+app = create_app()